@@ -1,5 +1,7 @@
 """CTT config."""
 
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 
 from corallium.log import get_logger
@@ -15,12 +17,20 @@ def _validate_config(config: dict) -> None:  # type: ignore[type-arg]
         raise RuntimeError('CTT expected headers like: [output."<something>"]')
 
 
+@lru_cache(maxsize=128)
+def _parse_toml(path_str: str, mtime_ns: int, size: int) -> dict:  # type: ignore[type-arg]  # noqa: ARG001
+    """Parse the TOML file once per unique file stat (`mtime_ns` and `size` are only used for the cache key)."""
+    with Path(path_str).open('rb') as toml_file:
+        return tomllib.load(toml_file)
+
+
 def load_config(base_dir: Path) -> dict:  # type: ignore[type-arg]
     """Read the ctt config from `CWD`."""
     cfg_path = base_dir / 'ctt.toml'
     if not cfg_path.is_file():  # pragma: no cover
         msg = f'No configuration file found. Expected: {cfg_path.absolute()}'
         raise ValueError(msg)
-    config: dict = tomllib.loads(cfg_path.read_text())  # type: ignore[type-arg]
+    stat = cfg_path.stat()
+    config = deepcopy(_parse_toml(str(cfg_path.resolve()), stat.st_mtime_ns, stat.st_size))
     _validate_config(config)
     return config
@@ -1,18 +1,19 @@
 """Template Directory Writer."""
 
+import os
 import re
 import shutil
 import stat
+import subprocess  # noqa: S404
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager, suppress
 from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
-import copier
-from copier.template import load_template_config
-from corallium.file_helpers import read_lines
 from corallium.log import get_logger
-from corallium.shell import capture_shell
 
 logger = get_logger()
 
@@ -28,32 +29,58 @@ https://github.com/copier-org/copier/blob/7f05baf4f004a4876fb6158e1c532b28290146
 """
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=128)
+def _load_copier_template(copier_path_str: str, mtime_ns: int) -> dict:  # type: ignore[type-arg]  # noqa: ARG001
+    """Parse the copier template once per file modification (`mtime_ns` is only used for the cache key)."""
+    # Deferred because copier (and jinja2, pydantic, etc.) is slow to import and not needed for `--help`
+    from copier.template import load_template_config  # noqa: PLC0415
+
+    return load_template_config(conf_path=Path(copier_path_str))
+
+
 def read_copier_template(base_dir: Path) -> dict:  # type: ignore[type-arg]
     """Locate the copier file regardless of variation and return the content.
 
     https://github.com/copier-org/copier/blob/5827d6a6fc6592e64c983bc52a254471ecff7531/docs/creating.md?plain=1#L13-L14
 
     """
-    copier_path = base_dir / DEFAULT_TEMPLATE_FILE_NAME
-    if not copier_path.is_file():
-        copier_path = copier_path.with_suffix('.yml')
-    if not copier_path.is_file():  # pragma: no cover
-        msg = f"Can't find the copier template file. Expected: {copier_path} (or .yaml)"
-        raise FileNotFoundError(msg)
+    yaml_path = base_dir / DEFAULT_TEMPLATE_FILE_NAME
+    yml_path = yaml_path.with_suffix('.yml')
+    for copier_path in (yaml_path, yml_path):
+        # Reuse a single stat call for both the file check and the cache key
+        with suppress(FileNotFoundError, NotADirectoryError):
+            file_stat = copier_path.stat()
+            if stat.S_ISREG(file_stat.st_mode):
+                return _load_copier_template(str(copier_path.resolve()), file_stat.st_mtime_ns)
 
-    return load_template_config(conf_path=copier_path)
+    msg = f"Can't find the copier template file. Expected: {yml_path} (or .yaml)"  # pragma: no cover
+    raise FileNotFoundError(msg)  # pragma: no cover
+
+
+_JINJA_EXPRESSION_RE = re.compile(r'{{[^}]+}}')
+"""Match a jinja expression in a templated file name."""
 
 
-@lru_cache(maxsize=1)
 def _find_answers_file(*, src_path: Path, dst_path: Path) -> Path:
     """Locate the copier answers file based on the copier template."""
     copier_config = read_copier_template(src_path)
     answers_filename = copier_config.get('_answers_file') or DEFAULT_ANSWER_FILE_NAME
     if '{{' in answers_filename:
         # If the filename is created from the template, just grab the first match
-        search_name = re.sub(r'{{[^}]+}}', '*', answers_filename)
-        matches = [*dst_path.glob(search_name)]
+        search_name = _JINJA_EXPRESSION_RE.sub('*', answers_filename)
+        if search_name.count('*') == 1 and not any(_c in search_name for _c in '/?['):
+            # Avoid compiling a glob pattern for the common single substitution case
+            prefix, suffix = search_name.split('*')
+            min_length = len(prefix) + len(suffix)
+            with os.scandir(dst_path) as entries:
+                matches = [
+                    dst_path / _e.name
+                    for _e in entries
+                    if len(_e.name) >= min_length and _e.name.startswith(prefix) and _e.name.endswith(suffix)
+                ]
+        else:  # pragma: no cover
+            # Only the first two matches are needed to know if there is exactly one
+            matches = [*islice(dst_path.glob(search_name), 2)]
         if len(matches) != 1:  # pragma: no cover
             msg = f"Can't find just one copier answers file matching {dst_path / search_name}. Found: {matches}"
             raise ValueError(msg)
@@ -61,37 +88,80 @@ def _find_answers_file(*, src_path: Path, dst_path: Path) -> Path:
     return dst_path / answers_filename  # pragma: no cover
 
 
-@lru_cache(maxsize=3)
 def _resolve_git_root_dir(base_dir: Path) -> Path:
-    """Use git to list all untracked files."""
-    cmd = 'git rev-parse --show-toplevel'
-    output = capture_shell(cmd=cmd, cwd=base_dir)
+    """Resolve the root of the git repository, preferring a filesystem check over spawning `git`."""
+    # Resolve before the cached lookup so that equivalent relative and absolute paths share an entry
+    return _resolve_git_root_dir_cached(base_dir.resolve())
+
+
+@lru_cache(maxsize=128)
+def _resolve_git_root_dir_cached(resolved_dir: Path) -> Path:
+    for directory in (resolved_dir, *resolved_dir.parents):
+        # A '.git' directory (or file for worktrees and submodules) marks the top level
+        if (directory / '.git').exists():
+            return directory
+    cmd = ['git', 'rev-parse', '--show-toplevel']
+    output = subprocess.run(cmd, cwd=resolved_dir, capture_output=True, text=True, check=True).stdout  # noqa: S603
     return Path(output.strip())
 
 
-def _stabilize(line: str, answers_path: Path) -> str:
-    # Convert _src_path to a deterministic relative path
-    if line.startswith('_src_path'):
-        logger.info('Replacing with deterministic value', line=line)
-        raw_path = Path(line.split('_src_path:')[-1].strip())
-        ans_dir = answers_path.parent
-        if ans_dir.is_relative_to(raw_path):
-            count_rel = len(ans_dir.relative_to(raw_path).parts)
-            rel_path = '/'.join([*(['..'] * count_rel), raw_path.name])
-            return f'_src_path: {rel_path}'
-        return line
+_STABILIZE_RE = re.compile(r'^(?P<key>_src_path|_commit):[ \t]*(?P<value>.*)$', re.MULTILINE)
+"""Match the answers file keys that `_stabilize_answers_file` replaces with deterministic values."""
+
+_BLANK_LINE_RE = re.compile(r'^\s*$\n?', re.MULTILINE)
+"""Match blank (or whitespace-only) lines to remove from the answers file."""
+
+
+def _stabilize_match(match: re.Match[str], answers_path: Path) -> str:
+    line = match[0]
+    logger.info('Replacing with deterministic value', line=line)
     # Create a stable tag for '_commit' that copier will still utilize
-    if line.startswith('_commit'):
-        logger.info('Replacing with deterministic value', line=line)
+    if match['key'] == '_commit':
         return '_commit: HEAD'
+    # Convert _src_path to a deterministic relative path
+    raw_path = Path(match['value'].strip())
+    ans_dir = answers_path.parent
+    if ans_dir.is_relative_to(raw_path):
+        count_rel = len(ans_dir.relative_to(raw_path).parts)
+        rel_path = '/'.join([*(['..'] * count_rel), raw_path.name])
+        return f'_src_path: {rel_path}'
     return line
 
 
 def _stabilize_answers_file(*, src_path: Path, dst_path: Path) -> None:
     """Ensure that the answers file is deterministic."""
     answers_path = _find_answers_file(src_path=src_path, dst_path=dst_path)
-    lines = (_stabilize(_l, answers_path) for _l in read_lines(answers_path) if _l.strip())
-    answers_path.write_text('\n'.join(lines) + '\n')
+    text = answers_path.read_text(encoding='utf-8')
+    # Substitute over the whole file at once rather than dispatching per line
+    stable_text = _STABILIZE_RE.sub(lambda _m: _stabilize_match(_m, answers_path), text)
+    stable_text = _BLANK_LINE_RE.sub('', stable_text)
+    if not stable_text.endswith('\n'):
+        stable_text += '\n'
+    if stable_text != text:
+        answers_path.write_text(stable_text, encoding='utf-8')
+
+
+ANSWERS_TEMPLATE_NAME = '{{ _copier_conf.answers_file }}.jinja'
+"""Template file name that indicates the generated project can be updated by copier."""
+
+
+_SKIPPED_TEMPLATE_DIRS = frozenset({'.ctt', '.git', '__pycache__', 'node_modules'})
+"""Directories that can't contain the template's answers file (`.ctt` is generated output and excluded by copier)."""
+
+
+@lru_cache(maxsize=128)
+def _has_answers_template(src_path: Path) -> bool:
+    """Search the template once for the answers file template, stopping at the first match."""
+    stack = [str(src_path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                # Filter by name first so that only candidate directories need a type check
+                if entry.name == ANSWERS_TEMPLATE_NAME:
+                    return True
+                if entry.name not in _SKIPPED_TEMPLATE_DIRS and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return False
 
 
 @contextmanager
@@ -103,8 +173,7 @@ def _output_dir(*, src_path: Path, dst_path: Path):  # noqa: ANN202
     Addresses: <https://github.com/KyleKing/copier-template-tester/issues/24>
 
     """
-    template_name = '{{ _copier_conf.answers_file }}.jinja'
-    has_answers_template = any(src_path.rglob(template_name))
+    has_answers_template = _has_answers_template(src_path.resolve())
 
     dst_path.mkdir(parents=True, exist_ok=True)
     yield
@@ -144,6 +213,8 @@ def write_output(*, src_path: Path, dst_path: Path, data: dict[str, bool | int |
     kwargs documentation: https://github.com/copier-org/copier/blob/103828b59fd9eb671b5ffa909004d1577742300b/copier/main.py#L86-L173
 
     """
+    import copier  # noqa: PLC0415
+
     with _output_dir(src_path=src_path, dst_path=dst_path):
         kwargs.setdefault('cleanup_on_error', False)
         kwargs.setdefault('data', data or {})
@@ -163,3 +234,27 @@ def write_output(*, src_path: Path, dst_path: Path, data: dict[str, bool | int |
                 shutil.rmtree(git_path, onexc=_remove_readonly)  # type: ignore[call-arg]
             else:
                 shutil.rmtree(git_path, onerror=_remove_readonly)
+
+
+def _write_labeled_output(key: str, job: dict[str, Any]) -> None:
+    """Log which output is being created immediately before the copier output for it."""
+    logger.text(f'Using `copier` to create: {key}')
+    write_output(**job)
+
+
+def write_outputs(jobs: dict[str, dict[str, Any]], *, max_workers: int | None = 1) -> None:
+    """Run `write_output` for each output key and set of keyword arguments in `jobs`.
+
+    Each output has a distinct `dst_path`, so the jobs are independent and can be rendered in separate processes
+    (rather than threads because jinja rendering holds the GIL). `max_workers=None` uses all CPUs.
+
+    """
+    if max_workers == 1 or len(jobs) <= 1:
+        for key, job in jobs.items():
+            _write_labeled_output(key, job)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_write_labeled_output, key, job) for key, job in jobs.items()]
+        for future in futures:
+            future.result()
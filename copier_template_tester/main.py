@@ -13,13 +13,13 @@ from corallium.loggers.plain_printer import plain_printer
 
 from ._config import load_config
 from ._pre_commit_support import check_for_untracked
-from ._write_output import DEFAULT_TEMPLATE_FILE_NAME, read_copier_template, write_output
+from ._write_output import DEFAULT_TEMPLATE_FILE_NAME, read_copier_template, write_outputs
 
 configure_logger(log_level=logging.INFO, logger=plain_printer)
 logger = get_logger()
 
 
-def run(*, base_dir: Path | None = None, check_untracked: bool = False) -> None:
+def run(*, base_dir: Path | None = None, check_untracked: bool = False, jobs: int | None = 1) -> None:
     """Entry point."""
     base_dir = base_dir or Path.cwd()
     try:
@@ -35,13 +35,11 @@ def run(*, base_dir: Path | None = None, check_untracked: bool = False) -> None:
     config = load_config(base_dir)
     defaults = config.get('defaults', {})
 
-    input_path = base_dir
-    paths = set()
-    for key, data in config['output'].items():
-        output_path = base_dir / key
-        paths.add(output_path)
-        logger.text(f'Using `copier` to create: {key}')
-        write_output(src_path=input_path, dst_path=base_dir / output_path, data=defaults | data)
+    write_jobs = {
+        key: {'src_path': base_dir, 'dst_path': base_dir / key, 'data': defaults | data}
+        for key, data in config['output'].items()
+    }
+    write_outputs(write_jobs, max_workers=jobs)
 
     if check_untracked:  # pragma: no cover
         check_for_untracked(base_dir)
@@ -55,6 +53,12 @@ def run_cli() -> None:  # pragma: no cover
         msg = f'Expected a path to a directory. Received: `{pth}`'
         raise ArgumentTypeError(msg)
 
+    def job_count(value: str) -> int:
+        if value.isdigit():
+            return int(value)
+        msg = f'Expected a non-negative integer. Received: `{value}`'
+        raise ArgumentTypeError(msg)
+
     cli = ArgumentParser()
     cli.add_argument(
         '-b',
@@ -62,6 +66,12 @@ def run_cli() -> None:  # pragma: no cover
         help='Specify the path to the directory that contains the configuration file',
         type=dir_path)
     cli.add_argument('--check-untracked', help='Only used for pre-commit', action='store_true')
+    cli.add_argument(
+        '-j',
+        '--jobs',
+        help='Number of outputs to render in parallel. Use 0 for one per CPU',
+        type=job_count,
+        default=1)
 
     args = cli.parse_args()
-    run(base_dir=args.base_dir, check_untracked=args.check_untracked)
+    run(base_dir=args.base_dir, check_untracked=args.check_untracked, jobs=args.jobs or None)
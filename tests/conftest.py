@@ -1,10 +1,17 @@
 """Pytest configuration."""
 
+import shutil
 from pathlib import Path
 
 import pytest
 
 from .configuration import TEST_TMP_CACHE, clear_test_cache
+from .helpers import run_git
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register custom markers."""
+    config.addinivalue_line('markers', 'slow: integration tests that run copier (deselect with `-m "not slow"`)')
 
 
 @pytest.fixture
@@ -17,3 +24,45 @@ def fix_test_cache() -> Path:
     """
     clear_test_cache()
     return TEST_TMP_CACHE
+
+
+@pytest.fixture(scope='session')
+def git_template_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture to initialize an empty git repository once per session for `temporary_git_dir` to copy.
+
+    Returns:
+        Path: Path to the directory that contains the template `.git` directory
+
+    """
+    template_dir = tmp_path_factory.mktemp('git_template')
+    run_git('init', cwd=template_dir)
+    return template_dir
+
+
+@pytest.fixture(scope='session')
+def git_baseline_dir(tmp_path_factory: pytest.TempPathFactory, git_template_dir: Path) -> Path:
+    """Fixture to build a git repository with a single commit once per session for `git_dir` to copy.
+
+    Returns:
+        Path: Path to the baseline repository
+
+    """
+    baseline_dir = tmp_path_factory.mktemp('git_baseline')
+    shutil.copytree(git_template_dir / '.git', baseline_dir / '.git')
+    (baseline_dir / 'init.txt').write_text('')
+    run_git('add', '.', cwd=baseline_dir)
+    run_git('commit', '-m=baseline', cwd=baseline_dir)
+    return baseline_dir
+
+
+@pytest.fixture
+def git_dir(git_baseline_dir: Path, tmp_path: Path) -> Path:
+    """Fixture to copy the baseline git repository into a test-specific directory.
+
+    Returns:
+        Path: Path to the copied repository with a clean working tree
+
+    """
+    working_dir = tmp_path / 'subdir'
+    shutil.copytree(git_baseline_dir, working_dir, symlinks=True)
+    return working_dir
@@ -1,5 +1,9 @@
+import os
 import shutil
+import subprocess  # noqa: S404
+import sys
 import tempfile
+import traceback
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
@@ -8,6 +12,8 @@ from corallium.log import get_logger
 from pytestshellutils.shell import Subprocess
 from pytestshellutils.utils.processes import ProcessResult
 
+from copier_template_tester.main import run_cli
+
 from .configuration import TEST_DATA_DIR, TEST_DIR
 
 logger = get_logger()
@@ -16,6 +22,9 @@ CTT_CMD = ['poetry', 'run', 'ctt']
 DEMO_DIR = TEST_DATA_DIR / 'copier_demo'
 NO_ANSWER_FILE_DIR = TEST_DATA_DIR / 'no_answers_file_demo'
 
+GIT_IDENTITY_ARGS = ('-c', 'user.email=tester@py.test', '-c', 'user.name=Pytest', '-c', 'commit.gpgsign=false')
+"""Per-invocation git configuration (required for Windows CI) that avoids separate `git config` processes."""
+
 
 class ExpectedError(Exception):
     """Test-only exception."""
@@ -26,6 +35,25 @@ def _log_shell(message: str, ret: ProcessResult, *args, **kwargs) -> None:
     logger.text(message, stdout=f'`{ret.stdout.strip()}`', stderr=f'`{ret.stderr.strip()}`', args=args, _kwargs=kwargs)
 
 
+def relative_files(root: Path, *, base: Path) -> set[Path]:
+    """Recursively collect all files under `root` as paths relative to `base` (which must contain `root`).
+
+    Uses `os.scandir` to avoid an extra `stat` per entry and slices the path strings rather than `relative_to`.
+
+    """
+    prefix_len = len(str(base)) + len(os.sep)
+    paths: set[Path] = set()
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    paths.add(Path(entry.path[prefix_len:]))
+    return paths
+
+
 def run_ctt(shell: Subprocess, cwd: Path, args: list[str] | None = None) -> ProcessResult:
     """Run `ctt` in the specified directory."""
     ret = shell.run(*CTT_CMD, *(args or []), cwd=cwd)
@@ -33,6 +61,38 @@ def run_ctt(shell: Subprocess, cwd: Path, args: list[str] | None = None) -> Proc
     return ret
 
 
+def run_ctt_in_process(*, capsys, monkeypatch, cwd: Path, args: list[str] | None = None) -> ProcessResult:
+    """Run `ctt` in the current interpreter and return output in the same form as `run_ctt`.
+
+    Avoids the interpreter and import startup of `poetry run ctt`. Exit codes and uncaught exceptions are
+    translated to a return code like the CLI would produce.
+
+    """
+    argv = ['ctt', *(args or [])]
+    monkeypatch.chdir(cwd)
+    monkeypatch.setattr(sys, 'argv', argv)
+    capsys.readouterr()  # Discard any prior output
+    returncode = 0
+    try:
+        run_cli()
+    except SystemExit as exc:
+        # Match the interpreter: `None` is success and any other non-integer is printed to stderr as a failure
+        if exc.code is None:
+            returncode = 0
+        elif isinstance(exc.code, int):
+            returncode = exc.code
+        else:
+            sys.stderr.write(f'{exc.code}\n')
+            returncode = 1
+    except Exception:
+        traceback.print_exc()
+        returncode = 1
+    captured = capsys.readouterr()
+    ret = ProcessResult(returncode=returncode, stdout=captured.out, stderr=captured.err, cmdline=argv)
+    _log_shell('ran ctt in-process', ret)
+    return ret
+
+
 def run_check(shell: Subprocess, *args, **kwargs) -> ProcessResult:
     """Check that the shell process completed with exit code 0."""
     ret = shell.run(*args, **kwargs)
@@ -43,26 +103,34 @@ def run_check(shell: Subprocess, *args, **kwargs) -> ProcessResult:
     return ret
 
 
+def run_git(*args: str, cwd: Path) -> None:
+    """Run a git command with the test identity and fail if it is unsuccessful."""
+    # Discard stdout, but keep stderr on the `CalledProcessError` for debugging
+    cmd = ['git', *GIT_IDENTITY_ARGS, *args]
+    subprocess.run(cmd, cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)  # noqa: S603
+
+
 def add_commit(shell: Subprocess, cwd: Path) -> None:
     """Add and commit all files within the specified directory."""
     assert not cwd.is_relative_to(TEST_DIR.parent)  # Prevent accidents!
     run_check(shell, 'git', 'add', '.', cwd=cwd)
-    run_check(shell, 'git', 'commit', '-m="add-commit"', cwd=cwd)
+    run_check(shell, 'git', *GIT_IDENTITY_ARGS, 'commit', '-m="add-commit"', cwd=cwd)
 
 
 @contextmanager
-def temporary_git_dir(shell: Subprocess, *, source_dir: Path | None = None) -> Generator[Path, None, None]:
-    """Initialize a temporary directory for testing."""
+def temporary_git_dir(
+    shell: Subprocess,
+    *,
+    git_template_dir: Path,
+    source_dir: Path | None = None,
+) -> Generator[Path, None, None]:
+    """Initialize a temporary directory for testing by copying the session's initialized git repository."""
     with tempfile.TemporaryDirectory() as tmp_dir:
         working_dir = Path(tmp_dir) / (source_dir.name if source_dir else 'subdir')
         if source_dir:
             shutil.copytree(source_dir, working_dir)
         working_dir.mkdir(exist_ok=True)
-
-        run_check(shell, 'git', 'init', cwd=working_dir)
-        # Required for Windows CI and works without issue everywhere else
-        run_check(shell, 'git', 'config', '--local', 'user.email', 'tester@py.test', cwd=working_dir)
-        run_check(shell, 'git', 'config', '--local', 'user.name', 'Pytest', cwd=working_dir)
+        shutil.copytree(git_template_dir / '.git', working_dir / '.git')
         if source_dir:
             add_commit(shell, cwd=working_dir)
 
@@ -1,9 +1,10 @@
 from contextlib import nullcontext as does_not_raise
+from pathlib import Path
 
 import pytest
 from corallium.log import get_logger
 
-from copier_template_tester._config import _validate_config
+from copier_template_tester._config import _validate_config, load_config
 
 logger = get_logger()
 
@@ -31,3 +32,12 @@ logger = get_logger()
 def test_validate_config(config: dict, expectation) -> None:  # type: ignore[type-arg]
     with expectation:
         _validate_config(config)
+
+
+def test_load_config_invalidates_on_change(tmp_path: Path) -> None:
+    cfg_path = tmp_path / 'ctt.toml'
+    cfg_path.write_text('[output.".ctt/first"]\n')
+    assert [*load_config(tmp_path)['output']] == ['.ctt/first']
+
+    cfg_path.write_text('[output.".ctt/second"]\nkey = "value"\n')
+    assert [*load_config(tmp_path)['output']] == ['.ctt/second']
@@ -1,34 +1,48 @@
+from collections.abc import Generator
 from pathlib import Path
 
 import copier
 import pytest
 from corallium.log import get_logger
-from pytestshellutils.shell import Subprocess
 
 from copier_template_tester.main import run
 
 from .configuration import TEST_DATA_DIR
-from .helpers import DEMO_DIR, NO_ANSWER_FILE_DIR, run_ctt
+from .helpers import DEMO_DIR, NO_ANSWER_FILE_DIR, relative_files, run_ctt_in_process
 
 logger = get_logger()
 
 WITH_INCLUDE_DIR = TEST_DATA_DIR / 'copier_include'
 
+ARGPARSE_USAGE_ERROR = 2
+"""Exit status from `ArgumentParser.error` for invalid CLI arguments."""
 
-@pytest.mark.parametrize('base_dir', [DEMO_DIR, NO_ANSWER_FILE_DIR])
-def test_main_with_copier_mock(monkeypatch, base_dir: Path) -> None:
-    """Only necessary for coverage metrics, but the .ctt/* files must exist."""
+
+@pytest.fixture(scope='class')
+def _mock_run_copy() -> Generator[None, None, None]:
+    """Stub `copier.run_copy` once for a test class and remove it before the real copier tests."""
 
     def _run_copy(src_path: str, dst_path: Path, **kwargs) -> None:
         pass
 
-    monkeypatch.setattr(copier, 'run_copy', _run_copy)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(copier, 'run_copy', _run_copy)
+        yield
+
+
+@pytest.mark.usefixtures('_mock_run_copy')
+class TestRunWithCopierMock:
+    """Group the mocked runs so the stub can be installed once for the parametrized cases."""
 
-    run(base_dir=base_dir)
+    @staticmethod
+    @pytest.mark.parametrize('base_dir', [DEMO_DIR, NO_ANSWER_FILE_DIR])
+    def test_main_with_copier_mock(base_dir: Path) -> None:
+        """Only necessary for coverage metrics, but the .ctt/* files must exist."""
+        run(base_dir=base_dir)
 
 
-def check_run_ctt(*, shell: Subprocess, cwd: Path, subdirname: str) -> set[Path]:
-    ret = run_ctt(shell, cwd=cwd)
+def check_run_ctt(*, capsys, monkeypatch, cwd: Path, subdirname: str) -> set[Path]:
+    ret = run_ctt_in_process(capsys=capsys, monkeypatch=monkeypatch, cwd=cwd)
 
     assert ret.returncode == 0, ret.stderr
     # Check output from ctt and copier (where order can vary on Windows)
@@ -42,46 +56,54 @@ def check_run_ctt(*, shell: Subprocess, cwd: Path, subdirname: str) -> set[Path]
         '*Copying from template*',
     ])
     # Check a few of the created files:
-    return {pth.relative_to(cwd) for pth in (cwd / '.ctt').rglob('*.*') if pth.is_file()}
+    return relative_files(cwd / '.ctt', base=cwd)
 
 
-def test_main(shell: Subprocess) -> None:
-    paths = check_run_ctt(shell=shell, cwd=DEMO_DIR, subdirname='no_all')
+def test_main(capsys, monkeypatch) -> None:
+    paths = check_run_ctt(capsys=capsys, monkeypatch=monkeypatch, cwd=DEMO_DIR, subdirname='no_all')
 
     assert Path('.ctt/no_all/README.md') in paths
     assert Path('.ctt/no_all/.copier-answers.testing_no_all.yml') in paths
     assert Path('.ctt/no_all/.copier-answers.yml') not in paths
 
 
-def test_no_answer_file_dir(shell: Subprocess) -> None:
-    paths = check_run_ctt(shell=shell, cwd=NO_ANSWER_FILE_DIR, subdirname='no_answers_file')
+def test_no_answer_file_dir(capsys, monkeypatch) -> None:
+    paths = check_run_ctt(capsys=capsys, monkeypatch=monkeypatch, cwd=NO_ANSWER_FILE_DIR, subdirname='no_answers_file')
 
     assert Path('.ctt/no_answers_file/README.md') in paths
     assert not [*Path('.ctt/no_answers_file').rglob('.copier-answers*')]
 
 
-def test_with_include_dir(shell: Subprocess) -> None:
-    paths = check_run_ctt(shell=shell, cwd=WITH_INCLUDE_DIR, subdirname='copier_include')
+def test_with_include_dir(capsys, monkeypatch) -> None:
+    paths = check_run_ctt(capsys=capsys, monkeypatch=monkeypatch, cwd=WITH_INCLUDE_DIR, subdirname='copier_include')
 
     assert Path('.ctt/copier_include/script.py') in paths
 
 
-def test_missing_copier_config(shell: Subprocess) -> None:
-    ret = run_ctt(shell, cwd=TEST_DATA_DIR / 'no_copier_config')
+def test_missing_copier_config(capsys, monkeypatch) -> None:
+    ret = run_ctt_in_process(capsys=capsys, monkeypatch=monkeypatch, cwd=TEST_DATA_DIR / 'no_copier_config')
 
     assert ret.returncode == 0
     ret.stdout.matcher.fnmatch_lines(["Please add a 'copier.yaml' file to '*no_copier_config'*"])
 
 
-def test_missing_ctt_config(shell: Subprocess) -> None:
-    ret = run_ctt(shell, cwd=TEST_DATA_DIR / 'no_ctt_config')
+def test_missing_ctt_config(capsys, monkeypatch) -> None:
+    ret = run_ctt_in_process(capsys=capsys, monkeypatch=monkeypatch, cwd=TEST_DATA_DIR / 'no_ctt_config')
 
     assert ret.returncode == 1
     ret.stderr.matcher.fnmatch_lines(['*No configuration file found. Expected: *ctt.toml*'])
 
 
-def test_no_subdir(shell: Subprocess) -> None:
-    ret = run_ctt(shell, cwd=TEST_DATA_DIR / 'no_subdir_nor_exclude')
+def test_no_subdir(capsys, monkeypatch) -> None:
+    ret = run_ctt_in_process(capsys=capsys, monkeypatch=monkeypatch, cwd=TEST_DATA_DIR / 'no_subdir_nor_exclude')
 
     assert ret.returncode == 0
     ret.stdout.matcher.fnmatch_lines(['*Using `copier` to create: .ctt/no_subdir_nor_exclude*'])
+
+
+@pytest.mark.parametrize('jobs', ['-1', 'all'])
+def test_invalid_jobs(capsys, monkeypatch, jobs: str) -> None:
+    ret = run_ctt_in_process(capsys=capsys, monkeypatch=monkeypatch, cwd=DEMO_DIR, args=[f'--jobs={jobs}'])
+
+    assert ret.returncode == ARGPARSE_USAGE_ERROR
+    ret.stderr.matcher.fnmatch_lines([f'*--jobs: Expected a non-negative integer. Received: `{jobs}`*'])
@@ -1,13 +1,22 @@
 import sys
 from pathlib import Path
 
+import copier
 import pytest
 from pytestshellutils.shell import Subprocess
 
 from copier_template_tester._pre_commit_support import check_for_untracked
 
 from .configuration import TEST_DATA_DIR
-from .helpers import DEMO_DIR, ExpectedError, add_commit, run_ctt, temporary_git_dir
+from .helpers import (
+    DEMO_DIR,
+    ExpectedError,
+    add_commit,
+    relative_files,
+    run_ctt,
+    run_ctt_in_process,
+    temporary_git_dir,
+)
 
 
 @pytest.mark.parametrize(
@@ -16,35 +25,56 @@ from .helpers import DEMO_DIR, ExpectedError, add_commit, run_ctt, temporary_git
         ['.ctt'],
         ['out_2/.a'],
         ['out/a/b/c.txt'],
+        pytest.param([' '], marks=pytest.mark.skipif(sys.platform == 'win32', reason='Windows strips trailing spaces')),
     ],
     ids=[
         'check a top-level directory',
         'check a dotfile',
         'check a nested file',
+        'check a whitespace-only name',
     ],
 )
-def test_check_for_untracked(*, paths: list[str], shell: Subprocess, monkeypatch) -> None:
+def test_check_for_untracked(*, paths: list[str], git_dir: Path, monkeypatch) -> None:
 
     def raise_int(arg: int) -> None:
         msg = f'arg={arg}'
         raise ExpectedError(msg)
 
     monkeypatch.setattr(sys, 'exit', raise_int)
-    with temporary_git_dir(shell) as copier_dir:
-        (copier_dir / 'init.txt').write_text('')
-        add_commit(shell, cwd=copier_dir)
-        for pth in paths:
-            new_file = copier_dir / pth
-            new_file.parent.mkdir(exist_ok=True, parents=True)
-            new_file.write_text(pth)
+    new_files = {git_dir / pth: pth for pth in paths}
+    # Create each missing parent directory once (the repository root already exists)
+    for parent in {_f.parent for _f in new_files} - {git_dir}:
+        parent.mkdir(exist_ok=True, parents=True)
+    for new_file, pth in new_files.items():
+        new_file.write_text(pth)
+
+    with pytest.raises(ExpectedError, match=r'^arg=1$'):
+        check_for_untracked(git_dir)
+
 
-        with pytest.raises(ExpectedError, match=r'^arg=1$'):
-            check_for_untracked(copier_dir)
+def test_ctt_with_untracked_files_copier_mock(*, capsys, monkeypatch, shell: Subprocess, git_template_dir: Path):
+    untracked_name = 'untracked_file.txt'
+
+    def _run_copy(src_path: str, dst_path: Path, **kwargs) -> None:
+        (Path(dst_path) / untracked_name).write_text('Placeholder\n')
+
+    monkeypatch.setattr(copier, 'run_copy', _run_copy)
+    with temporary_git_dir(shell, git_template_dir=git_template_dir, source_dir=DEMO_DIR) as copier_dir:
+        args = [f'--base-dir={copier_dir}', '--check-untracked']
+        ret = run_ctt_in_process(capsys=capsys, monkeypatch=monkeypatch, cwd=TEST_DATA_DIR, args=args)
+        created = (copier_dir / '.ctt/no_all' / untracked_name).is_file()
+
+    assert ret.returncode == 1
+    assert created
+    # Only the untracked file check may fail the run
+    ret.stdout.matcher.fnmatch_lines(['*pre-commit error: untracked files must be added*'])
+    assert 'Traceback' not in ret.stderr
 
 
-def test_ctt_with_untracked_files(shell: Subprocess) -> None:
+@pytest.mark.slow
+def test_ctt_with_untracked_files(shell: Subprocess, git_template_dir: Path) -> None:
     untracked_file = Path('template_dir/untracked_file.txt')
-    with temporary_git_dir(shell, source_dir=DEMO_DIR) as copier_dir:
+    with temporary_git_dir(shell, git_template_dir=git_template_dir, source_dir=DEMO_DIR) as copier_dir:
         first_pass = run_ctt(shell, cwd=TEST_DATA_DIR, args=[f'--base-dir={copier_dir}'])
         assert first_pass.returncode == 0
 
@@ -52,7 +82,7 @@ def test_ctt_with_untracked_files(shell: Subprocess) -> None:
         add_commit(shell, cwd=copier_dir)
         ret = run_ctt(shell, cwd=TEST_DATA_DIR, args=[f'--base-dir={copier_dir}', '--check-untracked'])
         # Store paths to check later
-        paths = {pth.relative_to(copier_dir) for pth in (copier_dir / '.ctt').rglob('*.*') if pth.is_file()}
+        paths = relative_files(copier_dir / '.ctt', base=copier_dir)
 
     assert ret.returncode == 1
     # Check output from ctt and copier (where order can vary on Windows)
@@ -1,16 +1,27 @@
+import os
+import sys
 from pathlib import Path
 
 import pytest
 
+from copier_template_tester import _write_output
 from copier_template_tester._write_output import (
+    ANSWERS_TEMPLATE_NAME,
     DEFAULT_ANSWER_FILE_NAME,
+    _has_answers_template,
     _resolve_git_root_dir,
-    _stabilize,
+    _stabilize_answers_file,
+    write_outputs,
 )
 
-from .configuration import TEST_DATA_DIR
+from .configuration import TEST_DATA_DIR, TEST_DIR
+from .helpers import DEMO_DIR
 
-_ANSWERS_PATH = Path('project-subdir').absolute() / DEFAULT_ANSWER_FILE_NAME
+
+def _make_template(src_path: Path) -> None:
+    """Create a minimal copier template that uses the default answers file name."""
+    src_path.mkdir(parents=True)
+    (src_path / 'copier.yml').write_text('project_name:\n  type: str\n', encoding='utf-8')
 
 
 @pytest.mark.parametrize(
@@ -18,7 +29,7 @@ _ANSWERS_PATH = Path('project-subdir').absolute() / DEFAULT_ANSWER_FILE_NAME
     [
         (
             # https://github.com/KyleKing/copier-template-tester/issues/16
-            f'_src_path: {_ANSWERS_PATH.parent.as_posix()}',
+            '_src_path: {src_path}',
             '_src_path: project-subdir',
         ),
         (
@@ -26,12 +37,105 @@ _ANSWERS_PATH = Path('project-subdir').absolute() / DEFAULT_ANSWER_FILE_NAME
             '_commit: v6.4.0-0',
             '_commit: HEAD',
         ),
+        (
+            '_commit_message: unchanged',
+            '_commit_message: unchanged',
+        ),
+    ],
+)
+def test_stabilize(*, line: str, expected: str, tmp_path: Path) -> None:
+    src_path = tmp_path / 'project-subdir'
+    _make_template(src_path)
+    answers_path = src_path / DEFAULT_ANSWER_FILE_NAME
+    answers_path.write_text(f'{line.format(src_path=src_path.as_posix())}\n', encoding='utf-8')
+
+    _stabilize_answers_file(src_path=src_path, dst_path=src_path)
+
+    assert answers_path.read_text(encoding='utf-8') == f'{expected}\n'
+
+
+def test_stabilize_answers_file(tmp_path: Path) -> None:
+    src_path = tmp_path / 'template'
+    dst_path = src_path / '.ctt' / 'output'
+    _make_template(src_path)
+    dst_path.mkdir(parents=True)
+    answers_path = dst_path / DEFAULT_ANSWER_FILE_NAME
+    answers_path.write_text(
+        f'_commit: v1.0.0\n\n_src_path: {src_path.as_posix()}\n  \t\nproject_name: demo',
+        encoding='utf-8',
+    )
+    expected = '_commit: HEAD\n_src_path: ../../template\nproject_name: demo\n'
+
+    _stabilize_answers_file(src_path=src_path, dst_path=dst_path)
+
+    assert answers_path.read_text(encoding='utf-8') == expected
+
+    # An already stable file must not be rewritten
+    os.utime(answers_path, ns=(0, 0))
+    _stabilize_answers_file(src_path=src_path, dst_path=dst_path)
+
+    assert answers_path.stat().st_mtime_ns == 0
+    assert answers_path.read_text(encoding='utf-8') == expected
+
 
+@pytest.mark.parametrize(
+    ('template_dir', 'expected'),
+    [
+        ('template_dir', True),
+        # Rendered output must not mark the source template as updatable
+        ('.ctt/output', False),
     ],
 )
-def test_stabilize(line: str, expected: str) -> None:
-    assert _stabilize(line, _ANSWERS_PATH) == expected
+def test_has_answers_template(*, template_dir: str, expected: bool, tmp_path: Path) -> None:
+    (tmp_path / template_dir).mkdir(parents=True)
+    (tmp_path / template_dir / ANSWERS_TEMPLATE_NAME).write_text('', encoding='utf-8')
+    _has_answers_template.cache_clear()
+
+    assert _has_answers_template(tmp_path) is expected
 
 
 def test_resolve_git_root_dir() -> None:
-    assert _resolve_git_root_dir(TEST_DATA_DIR) == TEST_DATA_DIR.parents[1]
+    assert _resolve_git_root_dir(TEST_DATA_DIR) == TEST_DIR.parent
+
+
+def test_write_outputs_serial(capsys, monkeypatch) -> None:
+
+    def _fake_write_output(*, dst_path: Path, **kwargs) -> None:
+        sys.stdout.write(f'rendered: {dst_path.name}\n')
+
+    def _no_pool(**kwargs) -> None:
+        raise AssertionError('Serial jobs must not start a process pool')
+
+    monkeypatch.setattr(_write_output, 'write_output', _fake_write_output)
+    monkeypatch.setattr(_write_output, 'ProcessPoolExecutor', _no_pool)
+    jobs = {key: {'src_path': DEMO_DIR, 'dst_path': Path(key), 'data': {}} for key in ('out_a', 'out_b')}
+
+    write_outputs(jobs, max_workers=1)
+
+    stdout = capsys.readouterr().out
+    expected_order = [
+        'Using `copier` to create: out_a',
+        'rendered: out_a',
+        'Using `copier` to create: out_b',
+        'rendered: out_b',
+    ]
+    # Each log line must precede the output of that job rather than being printed all at once
+    positions = [stdout.index(_text) for _text in expected_order]
+    assert positions == sorted(positions)
+
+
+def test_write_outputs_in_parallel(tmp_path: Path) -> None:
+    jobs = {
+        f'out_{idx}': {
+            'src_path': DEMO_DIR,
+            'dst_path': tmp_path / f'out_{idx}',
+            'data': {'project_name': f'demo-{idx}', 'include_all': False},
+        }
+        for idx in range(2)
+    }
+
+    write_outputs(jobs, max_workers=2)
+
+    for idx in range(2):
+        assert (tmp_path / f'out_{idx}' / f'.copier-answers.demo_{idx}.yml').is_file()
+        assert (tmp_path / f'out_{idx}' / 'README.md').is_file()
@@ -1,16 +1,20 @@
 """Final test alphabetically (zz) to catch general integration cases."""
 
+import re
 from pathlib import Path
 
-from corallium.tomllib import tomllib
-
 from copier_template_tester import __version__
 
+_POETRY_VERSION_RE = re.compile(
+    rb'^\[tool\.poetry\][ \t]*\r?$(?:(?!^\[).)*?^version\s*=\s*"(?P<version>[^"]+)"',
+    re.MULTILINE | re.DOTALL,
+)
+"""Match the version in the `[tool.poetry]` table without parsing the rest of the TOML document (LF or CRLF)."""
+
 
 def test_version():
     """Check that PyProject and package __version__ are equivalent."""
-    data = Path('pyproject.toml').read_text(encoding='utf-8')
-
-    result = tomllib.loads(data)['tool']['poetry']['version']
+    match = _POETRY_VERSION_RE.search(Path('pyproject.toml').read_bytes())
 
-    assert result == __version__
+    assert match
+    assert match['version'].decode() == __version__